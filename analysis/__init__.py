@@ -3,6 +3,7 @@
 from .profiling import (
     SkillData,
     BossData,
+    TimelinePoint,
     PlayerProfile,
     build_player_profile,
     compute_journey_data,
@@ -11,6 +12,7 @@ from .profiling import (
 __all__ = [
     "SkillData",
     "BossData",
+    "TimelinePoint",
     "PlayerProfile",
     "build_player_profile",
     "compute_journey_data",
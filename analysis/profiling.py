@@ -1,14 +1,89 @@
 """Player profiling and playstyle analysis."""
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple, Any
-from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple, Any
+from datetime import datetime, timezone
+from bisect import bisect_right
+from heapq import nlargest
+from operator import itemgetter
 import math
+import sys
 
-from config import SKILLS, SKILL_CATEGORIES, BOSS_CATEGORIES, ARCHETYPE_CONFIG
+import numpy as np
 
+from config import (
+    SKILL_SET, SKILL_CATEGORIES, SKILL_TO_CATEGORY,
+    BOSS_CATEGORIES, BOSS_TO_CATEGORY, ARCHETYPE_CONFIG,
+)
 
-@dataclass
+
+_MAX_VIRTUAL_LEVEL = 126
+
+
+def _build_xp_thresholds(max_level: int) -> Tuple[int, ...]:
+    """Build the XP required for each level, indexed by level - 1."""
+    thresholds = [0]
+    points = 0
+    for level in range(1, max_level):
+        points += math.floor(level + 300 * 2 ** (level / 7))
+        thresholds.append(points // 4)
+    return tuple(thresholds)
+
+
+# XP needed for levels 1..126; bisect_right(table, xp) yields the level directly
+_VIRTUAL_XP_THRESHOLDS = _build_xp_thresholds(_MAX_VIRTUAL_LEVEL)
+_LEVEL_99_XP = _VIRTUAL_XP_THRESHOLDS[98]
+
+# Python 3.11+ fromisoformat accepts the trailing "Z" WOM timestamps use
+_ISO_HAS_Z = sys.version_info >= (3, 11)
+
+# Total level thresholds reported as journey milestones
+_LEVEL_MILESTONES = (500, 750, 1000, 1250, 1500, 1750, 2000, 2277)
+
+
+def _parse_timestamp(value: str) -> datetime:
+    """Parse a WOM ISO-8601 timestamp, raising ValueError if malformed."""
+    if _ISO_HAS_Z:
+        return datetime.fromisoformat(value)
+    return datetime.fromisoformat(value.replace("Z", "+00:00", 1))
+
+
+def _to_utc_naive(date: datetime) -> datetime:
+    """Normalize to naive UTC, the only form np.datetime64 represents."""
+    if date.tzinfo is None:
+        return date
+    return date.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def _empty_timeline_columns(size: int) -> Dict[str, np.ndarray]:
+    """Allocate the column arrays backing a journey timeline."""
+    return {
+        "date": np.empty(size, dtype="datetime64[us]"),
+        "total_level": np.empty(size, dtype=np.int32),
+        "total_xp": np.empty(size, dtype=np.int64),
+        "ehp": np.empty(size, dtype=np.float64),
+        "ehb": np.empty(size, dtype=np.float64),
+    }
+
+
+def _balance_score(values: Iterable[int]) -> float:
+    """Score how evenly XP is spread across categories (0-100, 50 if unknown)."""
+    n = total = sq_total = 0
+    for v in values:
+        n += 1
+        total += v
+        sq_total += v * v
+    if n == 0 or total <= 0:
+        return 50
+    mean_xp = total / n
+    # Integer XP keeps n*sum(v^2) - sum(v)^2 exact, avoiding cancellation
+    variance = (n * sq_total - total * total) / (n * n)
+    cv = (variance ** 0.5) / mean_xp  # Coefficient of variation
+    # Lower CV = more balanced, convert to 0-100 score
+    return max(0, 100 - cv * 100)
+
+
+@dataclass(slots=True)
 class SkillData:
     """Skill statistics for a player."""
     name: str
@@ -20,29 +95,16 @@ class SkillData:
     @property
     def virtual_level(self) -> int:
         """Calculate virtual level beyond 99."""
-        if self.experience < 13034431:  # Level 99 XP
+        if self.experience < _LEVEL_99_XP:
             return self.level
-        # Virtual level calculation
-        xp_table = [0, 83, 174, 276, 388, 512, 650, 801, 969, 1154, 1358, 1584, 1833, 2107, 
-                    2411, 2746, 3115, 3523, 3973, 4470, 5018, 5624, 6291, 7028, 7842, 8740,
-                    9730, 10824, 12031, 13363, 14833, 16456, 18247, 20224, 22406, 24815,
-                    27473, 30408, 33648, 37224, 41171, 45529, 50339, 55649, 61512, 67983,
-                    75127, 83014, 91721, 101333, 111945, 123660, 136594, 150872, 166636,
-                    184040, 203254, 224466, 247886, 273742, 302288, 333804, 368599, 407015,
-                    449428, 496254, 547953, 605032, 668051, 737627, 814445, 899257, 992895,
-                    1096278, 1210421, 1336443, 1475581, 1629200, 1798808, 1986068, 2192818,
-                    2421087, 2673114, 2951373, 3258594, 3597792, 3972294, 4385776, 4842295,
-                    5346332, 5902831, 6517253, 7195629, 7944614, 8771558, 9684577, 10692629,
-                    11805606, 13034431]
-        
-        for level in range(99, 127):
-            xp_for_level = int(sum(math.floor(l + 300 * 2**(l/7)) / 4 for l in range(1, level + 1)))
-            if self.experience < xp_for_level:
-                return level - 1
-        return 126
+        return min(_MAX_VIRTUAL_LEVEL, bisect_right(_VIRTUAL_XP_THRESHOLDS, self.experience))
+
+
+# Stand-in when a snapshot has no overall skill; only read, never mutated
+_DEFAULT_OVERALL = SkillData("overall", 1, 0, -1)
 
 
-@dataclass
+@dataclass(slots=True)
 class BossData:
     """Boss kill count data."""
     name: str
@@ -56,7 +118,17 @@ class BossData:
         return self.name.replace("_", " ").title()
 
 
-@dataclass
+@dataclass(slots=True)
+class TimelinePoint:
+    """Progression stats at a single snapshot."""
+    date: datetime
+    total_level: int
+    total_xp: int
+    ehp: float
+    ehb: float
+
+
+@dataclass(slots=True)
 class PlayerProfile:
     """Complete player profile with computed analytics."""
     
@@ -90,12 +162,14 @@ class PlayerProfile:
     archetype_description: str = ""
     playstyle_scores: Dict[str, float] = field(default_factory=dict)
     skill_category_xp: Dict[str, int] = field(default_factory=dict)
+    category_kc: Dict[str, np.ndarray] = field(default_factory=dict)  # aligned with BOSS_CATEGORIES
     top_skills: List[Tuple[str, int]] = field(default_factory=list)
     top_bosses: List[Tuple[str, int]] = field(default_factory=list)
     
     def analyze(self):
         """Compute all derived analytics for this profile."""
         self._compute_skill_categories()
+        self._compute_category_kc()
         self._compute_top_skills()
         self._compute_top_bosses()
         self._compute_playstyle_scores()
@@ -103,34 +177,47 @@ class PlayerProfile:
     
     def _compute_skill_categories(self):
         """Calculate total XP per skill category."""
-        self.skill_category_xp = {}
-        for category, skill_names in SKILL_CATEGORIES.items():
-            total = sum(
-                self.skills[s].experience 
-                for s in skill_names 
-                if s in self.skills
+        totals = dict.fromkeys(SKILL_CATEGORIES, 0)
+        for name, data in self.skills.items():
+            category = SKILL_TO_CATEGORY.get(name)
+            if category is not None:
+                totals[category] += data.experience
+        self.skill_category_xp = totals
+    
+    def _compute_category_kc(self):
+        """Collect kill counts per boss category, in BOSS_CATEGORIES order."""
+        self.category_kc = {
+            category: np.fromiter(
+                (self.bosses[b].kills if b in self.bosses else 0 for b in boss_names),
+                dtype=np.int64,
+                count=len(boss_names),
             )
-            self.skill_category_xp[category] = total
+            for category, boss_names in BOSS_CATEGORIES.items()
+        }
     
     def _compute_top_skills(self):
         """Find top 5 skills by XP (excluding overall)."""
-        skill_xp = [
-            (name, data.experience) 
-            for name, data in self.skills.items() 
-            if name != "overall"
-        ]
-        skill_xp.sort(key=lambda x: x[1], reverse=True)
-        self.top_skills = skill_xp[:5]
+        self.top_skills = nlargest(
+            5,
+            (
+                (name, data.experience) 
+                for name, data in self.skills.items() 
+                if name != "overall"
+            ),
+            key=itemgetter(1),
+        )
     
     def _compute_top_bosses(self):
         """Find top 5 bosses by kill count."""
-        boss_kc = [
-            (name, data.kills) 
-            for name, data in self.bosses.items() 
-            if data.kills > 0
-        ]
-        boss_kc.sort(key=lambda x: x[1], reverse=True)
-        self.top_bosses = boss_kc[:5]
+        self.top_bosses = nlargest(
+            5,
+            (
+                (name, data.kills) 
+                for name, data in self.bosses.items() 
+                if data.kills > 0
+            ),
+            key=itemgetter(1),
+        )
     
     def _compute_playstyle_scores(self):
         """Calculate playstyle dimension scores (0-100)."""
@@ -139,49 +226,28 @@ class PlayerProfile:
         # EHP/EHB balance (0 = pure PvM, 100 = pure skiller)
         if self.ehb > 0:
             ratio = self.ehp / self.ehb
-            if ratio > config["ehp_ehb_ratio_skiller"]:
-                skiller_score = 100
-            elif ratio < config["ehp_ehb_ratio_pvmer"]:
-                skiller_score = 0
-            else:
-                # Linear interpolation
-                skiller_score = (ratio - config["ehp_ehb_ratio_pvmer"]) / (
-                    config["ehp_ehb_ratio_skiller"] - config["ehp_ehb_ratio_pvmer"]
-                ) * 100
+            lo = config["ehp_ehb_ratio_pvmer"]
+            hi = config["ehp_ehb_ratio_skiller"]
+            # Linear interpolation between the thresholds, clamped to 0-100
+            skiller_score = max(0.0, min(100.0, (ratio - lo) * 100.0 / (hi - lo)))
         else:
             skiller_score = 100 if self.ehp > 0 else 50
         
         self.playstyle_scores["skiller_vs_pvmer"] = skiller_score
         
         # Boss diversity
-        bosses_with_kc = len([b for b in self.bosses.values() if b.kills > 0])
+        bosses_with_kc = sum(1 for b in self.bosses.values() if b.kills > 0)
         diversity_score = min(100, bosses_with_kc / config["boss_diversity_high"] * 100)
         self.playstyle_scores["boss_diversity"] = diversity_score
         
         # Raid focus
-        raid_kc = sum(
-            self.bosses[b].kills 
-            for b in BOSS_CATEGORIES.get("Raids", []) 
-            if b in self.bosses
-        )
+        raid_kcs = self.category_kc.get("Raids")
+        raid_kc = int(raid_kcs.sum()) if raid_kcs is not None else 0
         raid_score = min(100, raid_kc / config["raid_kc_threshold"] * 100)
         self.playstyle_scores["raid_focus"] = raid_score
         
         # Skill balance (how evenly distributed is XP across categories)
-        if self.skill_category_xp:
-            values = list(self.skill_category_xp.values())
-            mean_xp = sum(values) / len(values)
-            if mean_xp > 0:
-                variance = sum((v - mean_xp) ** 2 for v in values) / len(values)
-                cv = (variance ** 0.5) / mean_xp  # Coefficient of variation
-                # Lower CV = more balanced, convert to 0-100 score
-                balance_score = max(0, 100 - cv * 100)
-            else:
-                balance_score = 50
-        else:
-            balance_score = 50
-        
-        self.playstyle_scores["skill_balance"] = balance_score
+        self.playstyle_scores["skill_balance"] = _balance_score(self.skill_category_xp.values())
         
         # Combat focus (combat XP / total XP)
         combat_xp = self.skill_category_xp.get("Combat", 0)
@@ -223,16 +289,10 @@ class PlayerProfile:
                 self.archetype_description = "Experienced across many different bosses"
             else:
                 # Check for specific boss focus
-                if self.top_bosses:
-                    top_boss = self.top_bosses[0][0]
-                    for category, bosses in BOSS_CATEGORIES.items():
-                        if top_boss in bosses:
-                            self.archetype = f"{category} Specialist"
-                            self.archetype_description = f"Primary focus on {category.lower()} content"
-                            break
-                    else:
-                        self.archetype = "PvMer"
-                        self.archetype_description = "Focuses on boss content and combat"
+                category = BOSS_TO_CATEGORY.get(self.top_bosses[0][0]) if self.top_bosses else None
+                if category:
+                    self.archetype = f"{category} Specialist"
+                    self.archetype_description = f"Primary focus on {category.lower()} content"
                 else:
                     self.archetype = "PvMer"
                     self.archetype_description = "Focuses on boss content and combat"
@@ -275,23 +335,24 @@ def build_player_profile(player_data: Dict, snapshots: List[Dict] = None) -> Pla
     
     # Extract latest snapshot data
     latest = player_data.get("latestSnapshot", {})
+    latest_data = latest.get("data", {})
     
     # Parse skills
-    skills_data = latest.get("data", {}).get("skills", {})
-    skills = {}
-    for skill_name in SKILLS:
-        if skill_name in skills_data:
-            s = skills_data[skill_name]
-            skills[skill_name] = SkillData(
-                name=skill_name,
-                level=s.get("level", 1),
-                experience=s.get("experience", 0),
-                rank=s.get("rank", -1),
-                ehp=s.get("ehp", 0.0)
-            )
+    skills_data = latest_data.get("skills", {})
+    skills = {
+        skill_name: SkillData(
+            name=skill_name,
+            level=s.get("level", 1),
+            experience=s.get("experience", 0),
+            rank=s.get("rank", -1),
+            ehp=s.get("ehp", 0.0)
+        )
+        for skill_name, s in skills_data.items()
+        if skill_name in SKILL_SET
+    }
     
     # Parse bosses
-    bosses_data = latest.get("data", {}).get("bosses", {})
+    bosses_data = latest_data.get("bosses", {})
     bosses = {}
     for boss_name, b in bosses_data.items():
         kills = b.get("kills", 0)
@@ -304,12 +365,12 @@ def build_player_profile(player_data: Dict, snapshots: List[Dict] = None) -> Pla
             )
     
     # Extract computed metrics
-    computed = latest.get("data", {}).get("computed", {})
+    computed = latest_data.get("computed", {})
     ehp = computed.get("ehp", {}).get("value", 0.0)
     ehb = computed.get("ehb", {}).get("value", 0.0)
     
     # Core stats
-    overall_skill = skills.get("overall", SkillData("overall", 1, 0, -1))
+    overall_skill = skills.get("overall", _DEFAULT_OVERALL)
     combat_level = player_data.get("combatLevel", 3)
     
     # Snapshot metadata
@@ -317,9 +378,7 @@ def build_player_profile(player_data: Dict, snapshots: List[Dict] = None) -> Pla
     updated_str = player_data.get("updatedAt") or player_data.get("lastChangedAt")
     if updated_str:
         try:
-            if updated_str.endswith("Z"):
-                updated_str = updated_str[:-1] + "+00:00"
-            last_updated = datetime.fromisoformat(updated_str)
+            last_updated = _parse_timestamp(updated_str)
         except ValueError:
             pass
     
@@ -327,19 +386,13 @@ def build_player_profile(player_data: Dict, snapshots: List[Dict] = None) -> Pla
     first_snapshot = None
     if snapshots:
         snapshot_count = len(snapshots)
-        if snapshots:
-            try:
-                dates = []
-                for snap in snapshots:
-                    created = snap.get("createdAt")
-                    if created:
-                        if created.endswith("Z"):
-                            created = created[:-1] + "+00:00"
-                        dates.append(datetime.fromisoformat(created))
-                if dates:
-                    first_snapshot = min(dates)
-            except ValueError:
-                pass
+        try:
+            first_snapshot = min(
+                (_parse_timestamp(snap["createdAt"]) for snap in snapshots if snap.get("createdAt")),
+                default=None,
+            )
+        except ValueError:
+            pass
     
     # Build profile
     profile = PlayerProfile(
@@ -371,13 +424,16 @@ def compute_journey_data(snapshots: List[Dict]) -> Dict[str, Any]:
     Process snapshots into journey visualization data.
     
     Returns dict with:
-        - timeline: list of {date, total_level, total_xp, ehp, ehb}
+        - timeline: list of TimelinePoint (date, total_level, total_xp, ehp, ehb)
+        - timeline_columns: the same timeline as NumPy arrays keyed by field
+          (dates as naive UTC datetime64) for plotting and vectorized passes
         - milestones: list of detected milestones
         - data_coverage: description of available history
     """
     if not snapshots:
         return {
             "timeline": [],
+            "timeline_columns": _empty_timeline_columns(0),
             "milestones": [],
             "data_coverage": "No historical data available",
             "snapshot_count": 0,
@@ -385,15 +441,14 @@ def compute_journey_data(snapshots: List[Dict]) -> Dict[str, Any]:
     
     timeline = []
     
-    for snap in sorted(snapshots, key=lambda x: x.get("createdAt", "")):
-        created = snap.get("createdAt")
-        if not created:
-            continue
+    dated_snapshots = [snap for snap in snapshots if snap.get("createdAt")]
+    columns = _empty_timeline_columns(len(dated_snapshots))
+    
+    for snap in sorted(dated_snapshots, key=itemgetter("createdAt")):
+        created = snap["createdAt"]
         
         try:
-            if created.endswith("Z"):
-                created = created[:-1] + "+00:00"
-            date = datetime.fromisoformat(created)
+            date = _parse_timestamp(created)
         except ValueError:
             continue
         
@@ -403,36 +458,50 @@ def compute_journey_data(snapshots: List[Dict]) -> Dict[str, Any]:
         
         overall = skills.get("overall", {})
         
-        timeline.append({
-            "date": date,
-            "total_level": overall.get("level", 0),
-            "total_xp": overall.get("experience", 0),
-            "ehp": computed.get("ehp", {}).get("value", 0),
-            "ehb": computed.get("ehb", {}).get("value", 0),
-        })
+        point = TimelinePoint(
+            date=date,
+            total_level=overall.get("level", 0),
+            total_xp=overall.get("experience", 0),
+            ehp=computed.get("ehp", {}).get("value", 0),
+            ehb=computed.get("ehb", {}).get("value", 0),
+        )
+        
+        i = len(timeline)
+        columns["date"][i] = _to_utc_naive(date)
+        columns["total_level"][i] = point.total_level
+        columns["total_xp"][i] = point.total_xp
+        columns["ehp"][i] = point.ehp
+        columns["ehb"][i] = point.ehb
+        timeline.append(point)
+    
+    # Trim slots left unused by unparseable timestamps
+    columns = {name: values[:len(timeline)] for name, values in columns.items()}
     
     # Detect milestones (simplified)
     milestones = []
-    level_thresholds = [500, 750, 1000, 1250, 1500, 1750, 2000, 2277]
     
     if len(timeline) >= 2:
-        for i in range(1, len(timeline)):
-            prev_level = timeline[i-1]["total_level"]
-            curr_level = timeline[i]["total_level"]
-            
-            for threshold in level_thresholds:
-                if prev_level < threshold <= curr_level:
-                    milestones.append({
-                        "date": timeline[i]["date"],
-                        "type": "total_level",
-                        "value": threshold,
-                        "description": f"Reached {threshold} total level"
-                    })
+        levels = columns["total_level"]
+        prev_levels = levels[:-1]
+        curr_levels = levels[1:]
+        
+        for threshold in _LEVEL_MILESTONES:
+            crossed = (prev_levels < threshold) & (curr_levels >= threshold)
+            for i in np.flatnonzero(crossed) + 1:
+                milestones.append({
+                    "date": timeline[i].date,
+                    "type": "total_level",
+                    "value": threshold,
+                    "description": f"Reached {threshold} total level"
+                })
+        
+        milestones.sort(key=lambda m: m["date"])
     
     # Compute data coverage
     if timeline:
-        first_date = min(t["date"] for t in timeline)
-        last_date = max(t["date"] for t in timeline)
+        # Timeline is chronological, so the endpoints are the date extrema
+        first_date = timeline[0].date
+        last_date = timeline[-1].date
         days_covered = (last_date - first_date).days
         
         if days_covered < 7:
@@ -450,6 +519,7 @@ def compute_journey_data(snapshots: List[Dict]) -> Dict[str, Any]:
     
     return {
         "timeline": timeline,
+        "timeline_columns": columns,
         "milestones": milestones,
         "data_coverage": coverage,
         "snapshot_count": len(timeline),
@@ -4,6 +4,7 @@ Playstyle profiling and journey visualization using WiseOldMan data.
 """
 
 import streamlit as st
+import plotly.io as pio
 from typing import Optional
 
 from config import (
@@ -11,12 +12,13 @@ from config import (
     WOM_API_BASE, WOM_USER_AGENT,
     CACHE_TTL_PLAYER, CACHE_TTL_SNAPSHOTS,
 )
-from services import WOMClient
+from services import WOMClient, CachedWOMClient
 from analysis import build_player_profile, compute_journey_data
 from ui import (
-    CUSTOM_CSS,
+    inject_css,
     render_empty_state,
     render_api_status,
+    get_account_badges,
     render_profile_page,
     render_skills_page,
     render_bosses_page,
@@ -33,7 +35,11 @@ st.set_page_config(
 )
 
 # Apply custom CSS
-st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
+inject_css()
+
+# st.plotly_chart serializes figures via plotly.io.to_json; pin the orjson
+# engine (already a dependency) rather than relying on "auto" detection
+pio.json.config.default_engine = "orjson"
 
 
 # ===== Cached API Functions =====
@@ -48,42 +54,63 @@ def get_api_client() -> WOMClient:
     except Exception:
         pass
     
-    return WOMClient(
+    return CachedWOMClient(
         base_url=WOM_API_BASE,
         api_key=api_key,
         user_agent=WOM_USER_AGENT
     )
 
 
-@st.cache_data(ttl=CACHE_TTL_PLAYER, show_spinner=False)
-def fetch_player(_client: WOMClient, username: str):
-    """Fetch player details."""
-    try:
-        return _client.get_player_details(username)
-    except Exception as e:
-        st.error(f"Failed to fetch player: {e}")
-        return None
-
-
+# Player details and snapshots share one cache entry so the profile and
+# journey are always built from the same fetch. The pair uses the snapshot
+# TTL; the Refresh button clears it when fresher player details are needed.
 @st.cache_data(ttl=CACHE_TTL_SNAPSHOTS, show_spinner=False)
-def fetch_snapshots(_client: WOMClient, username: str):
-    """Fetch player snapshots."""
-    try:
-        return _client.get_player_snapshots(username)
-    except Exception as e:
-        st.warning(f"Could not fetch snapshots: {e}")
-        return []
+def fetch_player_bundle(_client: WOMClient, username: str):
+    """Fetch player details and snapshots concurrently."""
+    bundle = _client.fetch_profile_bundle(username)
+    
+    player_data = bundle["player"]
+    if isinstance(player_data, Exception):
+        st.error(f"Failed to fetch player: {player_data}")
+        player_data = None
+    
+    snapshots = bundle["snapshots"]
+    if isinstance(snapshots, Exception):
+        st.warning(f"Could not fetch snapshots: {snapshots}")
+        snapshots = []
+    
+    return player_data, snapshots
 
 
 @st.cache_data(ttl=60, show_spinner=False)
 def search_players(_client: WOMClient, query: str):
-    """Search for players."""
+    """Search for players by a normalized (stripped, lowercased) query."""
     try:
         return _client.search_players(query)
     except Exception as e:
         return []
 
 
+# ===== Cached Analysis Functions =====
+
+@st.cache_data(ttl=CACHE_TTL_PLAYER, show_spinner=False)
+def get_player_profile(
+    username: str,
+    updated_at: str,
+    snapshot_count: int,
+    _player_data: dict,
+    _snapshots: list,
+):
+    """Build the analyzed profile, keyed by player and last update."""
+    return build_player_profile(_player_data, _snapshots)
+
+
+@st.cache_data(ttl=CACHE_TTL_SNAPSHOTS, show_spinner=False)
+def get_journey_data(username: str, updated_at: str, snapshot_count: int, _snapshots: list):
+    """Compute journey data, keyed by player and last update."""
+    return compute_journey_data(_snapshots)
+
+
 def main():
     """Main application."""
     
@@ -125,21 +152,20 @@ def main():
         # Search button
         search_clicked = st.button("Search", use_container_width=True, type="primary")
         
-        # Search results
-        if search_query and search_clicked:
+        # Search results (WOM search is case-insensitive, so normalize the cache key)
+        normalized_query = search_query.strip().lower()
+        if normalized_query and search_clicked:
             with st.spinner("Searching..."):
-                results = search_players(client, search_query)
+                results = search_players(client, normalized_query)
             
             if results:
                 st.success(f"Found {len(results)} player(s)")
                 
-                for player in results[:10]:  # Limit to 10 results
+                players = results[:10]  # Limit to 10 results
+                badges = get_account_badges(p.get("type", "regular") for p in players)
+                
+                for player, type_badge in zip(players, badges):
                     display = player.get("displayName", player.get("username", "Unknown"))
-                    player_type = player.get("type", "regular")
-                    
-                    type_badge = ""
-                    if player_type != "regular":
-                        type_badge = f" ({player_type.replace('_', ' ').title()})"
                     
                     if st.button(
                         f"{display}{type_badge}",
@@ -176,6 +202,7 @@ def main():
             if st.button("🔄 Refresh Data", use_container_width=True):
                 # Clear cache for this player
                 st.cache_data.clear()
+                client.clear_cache()
                 st.rerun()
             
             if st.button("❌ Clear", use_container_width=True):
@@ -203,10 +230,10 @@ def main():
             padding: 80px 20px;
         ">
             <div style="font-size: 64px; margin-bottom: 20px;">⚔️</div>
-            <h2 style="color: #D4AF37; font-family: 'Cinzel', serif;">
+            <h2 style="color: var(--primary); font-family: 'Cinzel', serif;">
                 Welcome to OSRS Player Analytics
             </h2>
-            <p style="color: #888; max-width: 600px; margin: 20px auto;">
+            <p style="color: var(--muted); max-width: 600px; margin: 20px auto;">
                 Search for any Old School RuneScape player to analyze their playstyle,
                 skill distribution, boss experience, and account progression.
             </p>
@@ -231,9 +258,9 @@ def main():
         
         return
     
-    # Load player data
+    # Load player data and history in one concurrent round trip
     with st.spinner(f"Loading {st.session_state.current_player}..."):
-        player_data = fetch_player(client, st.session_state.current_player)
+        player_data, snapshots = fetch_player_bundle(client, st.session_state.current_player)
     
     if not player_data:
         st.markdown(
@@ -247,13 +274,12 @@ def main():
         )
         return
     
-    # Load snapshots
-    with st.spinner("Loading historical data..."):
-        snapshots = fetch_snapshots(client, st.session_state.current_player)
-    
-    # Build profile
-    profile = build_player_profile(player_data, snapshots)
-    journey_data = compute_journey_data(snapshots)
+    # Build profile (reruns reuse the cached analysis until the player updates)
+    username = st.session_state.current_player
+    updated_at = player_data.get("updatedAt") or ""
+    snapshot_count = len(snapshots) if snapshots else 0
+    profile = get_player_profile(username, updated_at, snapshot_count, player_data, snapshots)
+    journey_data = get_journey_data(username, updated_at, snapshot_count, snapshots)
     
     # Store in session state
     st.session_state.player_profile = profile
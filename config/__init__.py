@@ -4,7 +4,8 @@ from .settings import (
     APP_TITLE, APP_ICON, APP_VERSION, APP_SUBTITLE,
     WOM_API_BASE, WOM_USER_AGENT,
     CACHE_TTL_PLAYER, CACHE_TTL_SNAPSHOTS, CACHE_TTL_ACHIEVEMENTS,
-    SKILLS, SKILL_CATEGORIES, BOSS_CATEGORIES,
+    SKILLS, SKILL_SET, SKILL_CATEGORIES, SKILL_TO_CATEGORY, BOSS_CATEGORIES,
+    BOSS_CATEGORY_SETS, BOSS_TO_CATEGORY,
     ARCHETYPE_CONFIG, COLORS,
 )
 
@@ -12,6 +13,7 @@ __all__ = [
     "APP_TITLE", "APP_ICON", "APP_VERSION", "APP_SUBTITLE",
     "WOM_API_BASE", "WOM_USER_AGENT",
     "CACHE_TTL_PLAYER", "CACHE_TTL_SNAPSHOTS", "CACHE_TTL_ACHIEVEMENTS",
-    "SKILLS", "SKILL_CATEGORIES", "BOSS_CATEGORIES",
+    "SKILLS", "SKILL_SET", "SKILL_CATEGORIES", "SKILL_TO_CATEGORY", "BOSS_CATEGORIES",
+    "BOSS_CATEGORY_SETS", "BOSS_TO_CATEGORY",
     "ARCHETYPE_CONFIG", "COLORS",
 ]
@@ -22,6 +22,7 @@ SKILLS = [
     "firemaking", "crafting", "smithing", "mining", "herblore", "agility",
     "thieving", "slayer", "farming", "runecrafting", "hunter", "construction"
 ]
+SKILL_SET = frozenset(SKILLS)
 
 # Skill categories for radar charts
 SKILL_CATEGORIES = {
@@ -31,6 +32,8 @@ SKILL_CATEGORIES = {
     "Support": ["agility", "thieving", "slayer", "runecrafting"],
 }
 
+SKILL_TO_CATEGORY = {skill: cat for cat, skills in SKILL_CATEGORIES.items() for skill in skills}
+
 # Bosses grouped by content type
 BOSS_CATEGORIES = {
     "Raids": ["chambers_of_xeric", "chambers_of_xeric_challenge_mode", "theatre_of_blood", 
@@ -46,6 +49,10 @@ BOSS_CATEGORIES = {
               "phantom_muspah", "duke_sucellus", "the_leviathan", "the_whisperer", "vardorvis"],
 }
 
+# Boss category lookups built once at import
+BOSS_CATEGORY_SETS = {cat: frozenset(bosses) for cat, bosses in BOSS_CATEGORIES.items()}
+BOSS_TO_CATEGORY = {boss: cat for cat, bosses in BOSS_CATEGORIES.items() for boss in bosses}
+
 # Playstyle archetype thresholds
 ARCHETYPE_CONFIG = {
     "ehp_ehb_ratio_skiller": 3.0,      # EHP/EHB > 3 = skiller-leaning
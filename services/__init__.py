@@ -1,5 +1,5 @@
 """Services module."""
 
-from .wom_client import WOMClient, parse_wom_datetime
+from .wom_client import WOMClient, CachedWOMClient, parse_wom_datetime
 
-__all__ = ["WOMClient", "parse_wom_datetime"]
+__all__ = ["WOMClient", "CachedWOMClient", "parse_wom_datetime"]
@@ -1,24 +1,82 @@
 """WiseOldMan API client for player data."""
 
 import time
-from typing import Dict, List, Optional, Any
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Any
 from datetime import datetime
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 
 
+# WOM timestamp layout, e.g. 2024-01-31T12:34:56.789Z
+_WOM_DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S.%f%z"
+
+
+@lru_cache(maxsize=4096)
 def parse_wom_datetime(dt_string: Optional[str]) -> Optional[datetime]:
     """Parse WOM API datetime string to Python datetime."""
     if not dt_string:
         return None
     try:
-        # Handle ISO format with Z suffix
-        if dt_string.endswith("Z"):
-            dt_string = dt_string[:-1] + "+00:00"
-        return datetime.fromisoformat(dt_string.replace("Z", "+00:00"))
+        # C-level fast path; accepts the Z suffix on Python 3.11+
+        return datetime.fromisoformat(dt_string)
+    except (ValueError, TypeError):
+        pass
+    try:
+        return datetime.strptime(dt_string, _WOM_DATETIME_FORMAT)
     except (ValueError, TypeError):
         return None
 
 
+def _retry_after_seconds(response: requests.Response) -> float:
+    """Read a numeric Retry-After header, defaulting to 0."""
+    try:
+        return max(0.0, float(response.headers.get("Retry-After", 0)))
+    except ValueError:
+        return 0.0
+
+
+class TokenBucket:
+    """Thread-safe token bucket allowing bursts of up to `capacity` requests."""
+    
+    def __init__(self, capacity: int, per_seconds: float = 60.0):
+        self.capacity = capacity
+        self.rate = capacity / per_seconds  # tokens per second
+        self._tokens = float(capacity)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def try_acquire(self) -> float:
+        """Take a token if available; otherwise return seconds until one is."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+    
+    def acquire(self):
+        """Block until a token is available."""
+        wait = self.try_acquire()
+        while wait:
+            time.sleep(wait)
+            wait = self.try_acquire()
+    
+    def drain(self, retry_after: float = 0.0):
+        """Empty the bucket, keeping it empty for `retry_after` seconds."""
+        with self._lock:
+            self._tokens = -retry_after * self.rate
+            self._last = time.monotonic()
+
+
 class WOMClient:
     """Client for WiseOldMan API v2."""
     
@@ -26,32 +84,49 @@ class WOMClient:
         self,
         base_url: str = "https://api.wiseoldman.net/v2",
         api_key: Optional[str] = None,
-        user_agent: str = "OSRS-Player-Analytics/1.0"
+        user_agent: str = "OSRS-Player-Analytics/1.0",
+        pool_size: int = 20,
     ):
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
         self.user_agent = user_agent
         self.session = requests.Session()
         
-        # Set up headers
+        # Pooled keep-alive connections with retries on transient failures.
+        # raise_on_status=False hands the final response back to _request so
+        # exhausted retries surface through the usual status handling. 429 is
+        # deliberately not retried here: it goes straight to _request, which
+        # drains the token bucket and fails fast instead of sleeping out
+        # Retry-After while spending more quota. Ignoring Retry-After also
+        # stops urllib3 retrying 429s on its own whenever the header is set.
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(500, 502, 503, 504),
+            respect_retry_after_header=False,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        
+        # Set up headers (ACCEPT_ENCODING lists every codec urllib3 can
+        # decode here, including br when brotli is installed)
         self.session.headers.update({
             "User-Agent": self.user_agent,
             "Accept": "application/json",
+            "Accept-Encoding": ACCEPT_ENCODING,
         })
         
         if self.api_key:
             self.session.headers["x-api-key"] = self.api_key
         
-        # Rate limiting
-        self._last_request_time = 0
-        self._min_request_interval = 0.1 if api_key else 0.5  # seconds
+        # Rate limiting: WOM allows 100 req/min with a key, 20 without
+        self._bucket = TokenBucket(100 if api_key else 20)
     
     def _rate_limit(self):
-        """Enforce rate limiting between requests."""
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self._min_request_interval:
-            time.sleep(self._min_request_interval - elapsed)
-        self._last_request_time = time.time()
+        """Wait for a rate limit token, allowing bursts up to the quota."""
+        self._bucket.acquire()
     
     def _request(self, method: str, endpoint: str, **kwargs) -> Any:
         """Make an API request with rate limiting."""
@@ -62,22 +137,31 @@ class WOMClient:
         try:
             response = self.session.request(method, url, timeout=30, **kwargs)
             response.raise_for_status()
-            return response.json()
+            content = response.content
+            return orjson.loads(content) if content else None
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 404:
                 return None
             elif e.response.status_code == 429:
+                self._bucket.drain(_retry_after_seconds(e.response))
                 raise Exception("Rate limit exceeded. Please wait and try again.")
-            raise Exception(f"API error: {e.response.status_code} - {e.response.text}")
+            raise Exception(f"API error: {e.response.status_code} - {e.response.text[:500]}")
+        except orjson.JSONDecodeError as e:
+            raise Exception(f"Invalid API response: {str(e)}")
         except requests.exceptions.RequestException as e:
             raise Exception(f"Request failed: {str(e)}")
     
+    @staticmethod
+    def _clean_params(params: Dict[str, Optional[str]]) -> Optional[Dict[str, str]]:
+        """Drop unset query parameters, returning None if nothing remains."""
+        return {k: v for k, v in params.items() if v} or None
+    
     def get_rate_limit_status(self) -> Dict[str, Any]:
         """Return current rate limit configuration."""
         return {
             "has_api_key": bool(self.api_key),
             "rate_limit": "100/min" if self.api_key else "20/min",
-            "request_interval": self._min_request_interval,
+            "request_interval": 1 / self._bucket.rate,
         }
     
     # Player endpoints
@@ -114,15 +198,8 @@ class WOMClient:
             start_date: ISO format date string
             end_date: ISO format date string
         """
-        params = {}
-        if period:
-            params["period"] = period
-        if start_date:
-            params["startDate"] = start_date
-        if end_date:
-            params["endDate"] = end_date
-        
-        result = self._request("GET", f"/players/{username}/snapshots", params=params or None)
+        params = self._clean_params({"period": period, "startDate": start_date, "endDate": end_date})
+        result = self._request("GET", f"/players/{username}/snapshots", params=params)
         return result if result else []
     
     def get_player_gains(
@@ -141,15 +218,8 @@ class WOMClient:
             start_date: ISO format date string
             end_date: ISO format date string
         """
-        params = {}
-        if period:
-            params["period"] = period
-        if start_date:
-            params["startDate"] = start_date
-        if end_date:
-            params["endDate"] = end_date
-        
-        return self._request("GET", f"/players/{username}/gained", params=params or None)
+        params = self._clean_params({"period": period, "startDate": start_date, "endDate": end_date})
+        return self._request("GET", f"/players/{username}/gained", params=params)
     
     def get_player_achievements(self, username: str) -> List[Dict]:
         """Get player achievements/milestones."""
@@ -173,16 +243,112 @@ class WOMClient:
     
     def get_player_records(self, username: str, period: Optional[str] = None, metric: Optional[str] = None) -> List[Dict]:
         """Get player records (best gains in a period)."""
-        params = {}
-        if period:
-            params["period"] = period
-        if metric:
-            params["metric"] = metric
-        
-        result = self._request("GET", f"/players/{username}/records", params=params or None)
+        params = self._clean_params({"period": period, "metric": metric})
+        result = self._request("GET", f"/players/{username}/records", params=params)
         return result if result else []
     
+    def fetch_profile_bundle(self, username: str) -> Dict[str, Any]:
+        """
+        Fetch player details and snapshots concurrently.
+        
+        Like asyncio.gather(return_exceptions=True), a failed request's
+        entry holds the raised exception so callers can degrade per endpoint.
+        
+        Returns:
+            Dict with "player" and "snapshots" results
+        """
+        calls = {
+            "player": (self.get_player_details, username),
+            "snapshots": (self.get_player_snapshots, username),
+        }
+        with ThreadPoolExecutor(max_workers=len(calls)) as executor:
+            futures = {key: executor.submit(fn, arg) for key, (fn, arg) in calls.items()}
+        
+        bundle = {}
+        for key, future in futures.items():
+            error = future.exception()
+            bundle[key] = error if error is not None else future.result()
+        return bundle
+    
+    def get_players_bulk(self, usernames: List[str], max_concurrency: int = 10) -> List[Any]:
+        """
+        Fetch many players concurrently, preserving input order.
+        
+        At most `max_concurrency` requests are in flight; the token bucket
+        still bounds the overall request rate. As in fetch_profile_bundle,
+        a failed lookup yields its exception in place of the result.
+        """
+        if not usernames:
+            return []
+        
+        def fetch(username: str) -> Any:
+            try:
+                return self.get_player(username)
+            except Exception as e:
+                return e
+        
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(usernames))) as executor:
+            return list(executor.map(fetch, usernames))
+    
     # Efficiency data
     def get_efficiency_rates(self) -> Optional[Dict]:
         """Get current EHP/EHB rates."""
         return self._request("GET", "/efficiency/rates")
+
+
+class CachedWOMClient(WOMClient):
+    """
+    WOMClient that serves the last good response when WOM errors.
+    
+    Freshness is left to the st.cache_data layer in front of the client, so
+    every call still goes to WOM. Successful responses are remembered by
+    (method, endpoint, params) for up to `stale_ttl` seconds, at most
+    `max_entries` of them, and are only returned if a later request for the
+    same endpoint fails.
+    """
+    
+    def __init__(
+        self,
+        *args,
+        stale_ttl: float = 3600,
+        max_entries: int = 32,
+        **kwargs
+    ):
+        super().__init__(*args, **kwargs)
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+        self._cache: "OrderedDict[Tuple, Tuple[float, Any]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+    
+    def _request(self, method: str, endpoint: str, **kwargs) -> Any:
+        """Fetch from WOM, falling back to a recent good response on error."""
+        params = kwargs.get("params") or {}
+        key = (method, endpoint, tuple(sorted(params.items())))
+        
+        try:
+            result = super()._request(method, endpoint, **kwargs)
+        except Exception:
+            # Stale-if-error: WOM hiccups shouldn't blank the dashboard
+            with self._cache_lock:
+                cached = self._cache.get(key)
+            if cached and time.monotonic() - cached[0] < self.stale_ttl:
+                return cached[1]
+            raise
+        
+        now = time.monotonic()
+        with self._cache_lock:
+            self._cache[key] = (now, result)
+            self._cache.move_to_end(key)
+            # Oldest entries sit at the front; drop them once past the
+            # stale window or over the size bound
+            while self._cache:
+                stored_at = next(iter(self._cache.values()))[0]
+                if len(self._cache) <= self.max_entries and now - stored_at < self.stale_ttl:
+                    break
+                self._cache.popitem(last=False)
+        return result
+    
+    def clear_cache(self):
+        """Drop all remembered responses."""
+        with self._cache_lock:
+            self._cache.clear()
@@ -1,6 +1,6 @@
 """UI module."""
 
-from .styles import CUSTOM_CSS, render_empty_state, render_api_status
+from .styles import CUSTOM_CSS, inject_css, render_empty_state, render_api_status, get_account_badge, get_account_badges
 from .components import (
     render_player_card,
     render_data_coverage,
@@ -26,8 +26,11 @@ from .pages import (
 __all__ = [
     # Styles
     "CUSTOM_CSS",
+    "inject_css",
     "render_empty_state",
     "render_api_status",
+    "get_account_badge",
+    "get_account_badges",
     # Components
     "render_player_card",
     "render_data_coverage",
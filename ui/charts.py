@@ -1,10 +1,68 @@
 """Plotly chart builders for player analytics."""
 
 import plotly.graph_objects as go
+from heapq import nlargest
 from typing import Dict, List, Any
-import pandas as pd
+import numpy as np
 
-from config import COLORS, SKILL_CATEGORIES
+from config import COLORS, SKILL_CATEGORIES, SKILL_TO_CATEGORY
+from ui.styles import hex_to_rgba
+
+
+# Shared layout pieces, applied via update_layout rather than a registered
+# Plotly template so Streamlit's default chart theme stays in effect.
+_TRANSPARENT = 'rgba(0,0,0,0)'
+_GRID_COLOR = hex_to_rgba(COLORS["muted"], 0.2)
+_POLAR_GRID_COLOR = hex_to_rgba(COLORS["muted"], 0.3)
+_BASE_LAYOUT = dict(
+    paper_bgcolor=_TRANSPARENT,
+    plot_bgcolor=_TRANSPARENT,
+    font=dict(color=COLORS["text"], family="Nunito"),
+    transition=dict(duration=0),
+)
+
+_CATEGORY_COLORS = {
+    "Combat": COLORS["combat"],
+    "Gathering": COLORS["gathering"],
+    "Artisan": COLORS["artisan"],
+    "Support": COLORS["support"],
+}
+
+# Beyond this many points the timeline drops per-point markers
+_TIMELINE_MARKER_LIMIT = 200
+
+
+def _empty_figure(message: str) -> go.Figure:
+    """Create a placeholder figure with a centered message."""
+    fig = go.Figure()
+    fig.add_annotation(
+        text=message,
+        xref="paper", yref="paper",
+        x=0.5, y=0.5,
+        showarrow=False,
+        font=dict(color=COLORS["muted"], size=14),
+    )
+    fig.update_layout(
+        paper_bgcolor=_TRANSPARENT,
+        plot_bgcolor=_TRANSPARENT,
+        height=300,
+    )
+    return fig
+
+
+def _category_xp(skills: Dict[str, Any], categories: Dict[str, List[str]]) -> Dict[str, int]:
+    """Sum skill XP per category in a single pass over the player's skills."""
+    if categories is SKILL_CATEGORIES:
+        skill_to_category = SKILL_TO_CATEGORY
+    else:
+        skill_to_category = {s: cat for cat, names in categories.items() for s in names}
+    
+    totals = dict.fromkeys(categories, 0)
+    for name, skill in skills.items():
+        category = skill_to_category.get(name)
+        if category is not None:
+            totals[category] += skill.experience
+    return totals
 
 
 def create_skill_radar(skills: Dict[str, Any], categories: Dict[str, List[str]] = None) -> go.Figure:
@@ -12,35 +70,20 @@ def create_skill_radar(skills: Dict[str, Any], categories: Dict[str, List[str]]
     if categories is None:
         categories = SKILL_CATEGORIES
     
-    category_names = []
-    category_scores = []
-    
-    # Calculate total XP per category first to find the max for relative scaling
-    category_xp = {}
-    for cat_name, skill_names in categories.items():
-        total_xp = sum(
-            skills[s].experience 
-            for s in skill_names 
-            if s in skills
-        )
-        category_xp[cat_name] = total_xp
-    
-    # Use relative scaling based on player's own distribution
-    max_cat_xp = max(category_xp.values()) if category_xp.values() else 1
-    
-    for cat_name, skill_names in categories.items():
-        total_xp = category_xp[cat_name]
-        # Scale relative to player's highest category (so highest is always 100)
-        if max_cat_xp > 0:
-            score = (total_xp / max_cat_xp) * 100
-        else:
-            score = 0
-        
-        category_names.append(cat_name)
-        category_scores.append(score)
+    category_xp = _category_xp(skills, categories)
+    category_names = list(category_xp)
+    xp = np.fromiter(category_xp.values(), dtype=np.float64, count=len(category_xp))
+    
+    # Scale relative to player's highest category (so highest is always 100)
+    max_cat_xp = xp.max() if xp.size else 0
+    if max_cat_xp > 0:
+        category_scores = xp / max_cat_xp * 100
+    else:
+        category_scores = np.zeros_like(xp)
     
+    # Close the polygon
     category_names.append(category_names[0])
-    category_scores.append(category_scores[0])
+    category_scores = np.append(category_scores, category_scores[:1])
     
     fig = go.Figure()
     
@@ -48,7 +91,7 @@ def create_skill_radar(skills: Dict[str, Any], categories: Dict[str, List[str]]
         r=category_scores,
         theta=category_names,
         fill='toself',
-        fillcolor='rgba(212, 175, 55, 0.2)',
+        fillcolor=hex_to_rgba(COLORS["primary"], 0.2),
         line=dict(color=COLORS["primary"], width=2),
         name='Skills'
     ))
@@ -60,18 +103,16 @@ def create_skill_radar(skills: Dict[str, Any], categories: Dict[str, List[str]]
                 visible=True,
                 range=[0, 100],
                 showticklabels=False,
-                gridcolor='rgba(136, 136, 136, 0.3)',
+                gridcolor=_POLAR_GRID_COLOR,
             ),
             angularaxis=dict(
-                gridcolor='rgba(136, 136, 136, 0.3)',
-                linecolor='rgba(136, 136, 136, 0.3)',
+                gridcolor=_POLAR_GRID_COLOR,
+                linecolor=_POLAR_GRID_COLOR,
             ),
         ),
         showlegend=False,
-        paper_bgcolor='rgba(0,0,0,0)',
-        plot_bgcolor='rgba(0,0,0,0)',
+        **_BASE_LAYOUT,
         margin=dict(l=60, r=60, t=40, b=40),
-        font=dict(color=COLORS["text"], family="Nunito"),
         height=350,
     )
     
@@ -116,17 +157,15 @@ def create_playstyle_bars(scores: Dict[str, float]) -> go.Figure:
         xaxis=dict(
             range=[0, 100],
             showgrid=True,
-            gridcolor='rgba(136, 136, 136, 0.2)',
+            gridcolor=_GRID_COLOR,
             title=None,
         ),
         yaxis=dict(
             title=None,
             autorange="reversed",
         ),
-        paper_bgcolor='rgba(0,0,0,0)',
-        plot_bgcolor='rgba(0,0,0,0)',
+        **_BASE_LAYOUT,
         margin=dict(l=120, r=20, t=20, b=40),
-        font=dict(color=COLORS["text"], family="Nunito"),
         height=250,
     )
     
@@ -136,29 +175,15 @@ def create_playstyle_bars(scores: Dict[str, float]) -> go.Figure:
 def create_boss_distribution(bosses: Dict[str, Any], top_n: int = 10) -> go.Figure:
     """Create horizontal bar chart of top bosses by KC."""
     
-    boss_data = [
-        (b.display_name, b.kills)
-        for b in bosses.values()
-        if b.kills > 0
-    ]
-    boss_data.sort(key=lambda x: x[1], reverse=True)
-    boss_data = boss_data[:top_n]
+    top_bosses = nlargest(
+        top_n,
+        (b for b in bosses.values() if b.kills > 0),
+        key=lambda b: b.kills,
+    )
+    boss_data = [(b.display_name, b.kills) for b in top_bosses]
     
     if not boss_data:
-        fig = go.Figure()
-        fig.add_annotation(
-            text="No boss kills recorded",
-            xref="paper", yref="paper",
-            x=0.5, y=0.5,
-            showarrow=False,
-            font=dict(color=COLORS["muted"], size=14),
-        )
-        fig.update_layout(
-            paper_bgcolor='rgba(0,0,0,0)',
-            plot_bgcolor='rgba(0,0,0,0)',
-            height=300,
-        )
-        return fig
+        return _empty_figure("No boss kills recorded")
     
     names, values = zip(*boss_data)
     
@@ -177,17 +202,15 @@ def create_boss_distribution(bosses: Dict[str, Any], top_n: int = 10) -> go.Figu
     fig.update_layout(
         xaxis=dict(
             showgrid=True,
-            gridcolor='rgba(136, 136, 136, 0.2)',
+            gridcolor=_GRID_COLOR,
             title="Kill Count",
         ),
         yaxis=dict(
             title=None,
             autorange="reversed",
         ),
-        paper_bgcolor='rgba(0,0,0,0)',
-        plot_bgcolor='rgba(0,0,0,0)',
+        **_BASE_LAYOUT,
         margin=dict(l=150, r=60, t=20, b=40),
-        font=dict(color=COLORS["text"], family="Nunito"),
         height=max(200, len(boss_data) * 35 + 60),
     )
     
@@ -202,35 +225,27 @@ def create_skill_distribution(skills: Dict[str, Any]) -> go.Figure:
     values = []
     colors = []
     
-    category_colors = {
-        "Combat": COLORS["combat"],
-        "Gathering": COLORS["gathering"],
-        "Artisan": COLORS["artisan"],
-        "Support": COLORS["support"],
-    }
-    
     labels.append("Total XP")
     parents.append("")
     values.append(0)
     colors.append(COLORS["surface"])
     
+    category_xp = _category_xp(skills, SKILL_CATEGORIES)
+    
     for cat_name, skill_names in SKILL_CATEGORIES.items():
-        cat_xp = sum(
-            skills[s].experience 
-            for s in skill_names 
-            if s in skills
-        )
+        color = _CATEGORY_COLORS.get(cat_name, COLORS["muted"])
         labels.append(cat_name)
         parents.append("Total XP")
-        values.append(cat_xp)
-        colors.append(category_colors.get(cat_name, COLORS["muted"]))
+        values.append(category_xp[cat_name])
+        colors.append(color)
         
         for skill in skill_names:
-            if skill in skills and skills[skill].experience > 0:
+            data = skills.get(skill)
+            if data is not None and data.experience > 0:
                 labels.append(skill.title())
                 parents.append(cat_name)
-                values.append(skills[skill].experience)
-                colors.append(category_colors.get(cat_name, COLORS["muted"]))
+                values.append(data.experience)
+                colors.append(color)
     
     fig = go.Figure(go.Treemap(
         labels=labels,
@@ -245,42 +260,30 @@ def create_skill_distribution(skills: Dict[str, Any]) -> go.Figure:
     ))
     
     fig.update_layout(
-        paper_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor=_TRANSPARENT,
         margin=dict(l=10, r=10, t=10, b=10),
         font=dict(color="white", family="Nunito"),
         height=400,
+        transition=dict(duration=0),
     )
     
     return fig
 
 
-def create_journey_timeline(timeline: List[Dict], milestones: List[Dict] = None) -> go.Figure:
-    """Create timeline chart showing player progression."""
-    
-    if not timeline:
-        fig = go.Figure()
-        fig.add_annotation(
-            text="Insufficient historical data for timeline",
-            xref="paper", yref="paper",
-            x=0.5, y=0.5,
-            showarrow=False,
-            font=dict(color=COLORS["muted"], size=14),
-        )
-        fig.update_layout(
-            paper_bgcolor='rgba(0,0,0,0)',
-            plot_bgcolor='rgba(0,0,0,0)',
-            height=300,
-        )
-        return fig
-    
-    df = pd.DataFrame(timeline)
+def create_journey_timeline(timeline: Dict[str, np.ndarray], milestones: List[Dict] = None) -> go.Figure:
+    """Create timeline chart showing player progression from timeline columns."""
+    
+    if len(timeline["date"]) == 0:
+        return _empty_figure("Insufficient historical data for timeline")
     
     fig = go.Figure()
     
-    fig.add_trace(go.Scatter(
-        x=df["date"],
-        y=df["total_level"],
-        mode='lines+markers',
+    # WebGL trace: long histories don't become thousands of SVG nodes
+    show_markers = len(timeline["date"]) <= _TIMELINE_MARKER_LIMIT
+    fig.add_trace(go.Scattergl(
+        x=timeline["date"],
+        y=timeline["total_level"],
+        mode='lines+markers' if show_markers else 'lines',
         name='Total Level',
         line=dict(color=COLORS["primary"], width=2),
         marker=dict(size=6),
@@ -299,18 +302,16 @@ def create_journey_timeline(timeline: List[Dict], milestones: List[Dict] = None)
     fig.update_layout(
         xaxis=dict(
             showgrid=True,
-            gridcolor='rgba(136, 136, 136, 0.2)',
+            gridcolor=_GRID_COLOR,
             title=None,
         ),
         yaxis=dict(
             showgrid=True,
-            gridcolor='rgba(136, 136, 136, 0.2)',
+            gridcolor=_GRID_COLOR,
             title="Total Level",
         ),
-        paper_bgcolor='rgba(0,0,0,0)',
-        plot_bgcolor='rgba(0,0,0,0)',
+        **_BASE_LAYOUT,
         margin=dict(l=60, r=20, t=40, b=40),
-        font=dict(color=COLORS["text"], family="Nunito"),
         height=350,
         hovermode="x unified",
         legend=dict(
@@ -357,8 +358,7 @@ def create_ehp_ehb_display(ehp: float, ehb: float) -> go.Figure:
     ))
     
     fig.update_layout(
-        paper_bgcolor='rgba(0,0,0,0)',
-        font=dict(color=COLORS["text"], family="Nunito"),
+        **_BASE_LAYOUT,
         height=150,
         margin=dict(l=20, r=20, t=20, b=20),
     )
@@ -1,12 +1,28 @@
 """Reusable UI components."""
 
 import streamlit as st
-from typing import Dict, List, Optional, Any
+from functools import lru_cache
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional, Any, Tuple
 
-from config import COLORS
+from config import COLORS, SKILL_CATEGORIES
 from analysis import PlayerProfile
 
 
+# Stat grid markup, filled per card/grid by render_stat_grid
+_STAT_CARD = (
+    '<div style="padding: 8px 0;">'
+    '<div style="color: var(--muted); font-size: 14px;">{label}</div>'
+    '<div style="font-size: 28px;">{value}</div>'
+    '</div>'
+).format
+_STAT_GRID = (
+    '<div style="display: grid; grid-template-columns: repeat({columns}, 1fr); gap: 16px;">'
+    '{cards}</div>'
+).format
+
+
 def render_player_card(profile: PlayerProfile) -> None:
     """Render the main player info card using native Streamlit components."""
     
@@ -40,9 +56,10 @@ def render_top_items(
     items: List[tuple],
     title: str,
     value_formatter: callable = lambda x: f"{x:,}",
-    icon: str = "🏆"
+    icon: str = "🏆",
+    columns: Tuple[str, str] = ("Name", "Value"),
 ) -> None:
-    """Render a ranked list of items."""
+    """Render a ranked list of items as a single table."""
     
     st.subheader(f"{icon} {title}")
     
@@ -50,11 +67,19 @@ def render_top_items(
         st.caption("No data available")
         return
     
-    for name, value in items:
-        display_name = name.replace("_", " ").title()
-        col1, col2 = st.columns([3, 1])
-        col1.write(display_name)
-        col2.write(f"**{value_formatter(value)}**")
+    name_col, value_col = columns
+    df = pd.DataFrame({
+        name_col: [name.replace("_", " ").title() for name, _ in items],
+        value_col: [value_formatter(value) for _, value in items],
+    })
+    st.dataframe(df, hide_index=True, use_container_width=True)
+
+
+def render_stat_grid(stats: List[Tuple[str, str]], columns: int = 4) -> None:
+    """Render label/value cards as one HTML grid instead of a metric per card."""
+    
+    cards = "".join(_STAT_CARD(label=label, value=value) for label, value in stats)
+    st.markdown(_STAT_GRID(columns=columns, cards=cards), unsafe_allow_html=True)
 
 
 def render_section_header(title: str, icon: str = "📊") -> None:
@@ -62,42 +87,49 @@ def render_section_header(title: str, icon: str = "📊") -> None:
     st.subheader(f"{icon} {title}")
 
 
+# (threshold, suffix, format spec), largest first; threshold doubles as divisor
+_XP_SUFFIXES = (
+    (1_000_000_000, "B", ".2f"),
+    (1_000_000, "M", ".1f"),
+    (1_000, "K", ".1f"),
+)
+
+
+def format_compact(
+    value: float,
+    suffixes: Tuple[Tuple[int, str, str], ...],
+    small_spec: str = "",
+) -> str:
+    """Format a value using the first suffix threshold it reaches."""
+    for threshold, suffix, spec in suffixes:
+        if value >= threshold:
+            return f"{value / threshold:{spec}}{suffix}"
+    return format(value, small_spec)
+
+
+@lru_cache(maxsize=4096)
 def format_xp(xp: int) -> str:
     """Format XP with appropriate suffix."""
-    if xp >= 1_000_000_000:
-        return f"{xp / 1_000_000_000:.2f}B"
-    elif xp >= 1_000_000:
-        return f"{xp / 1_000_000:.1f}M"
-    elif xp >= 1_000:
-        return f"{xp / 1_000:.1f}K"
-    return str(xp)
+    return format_compact(xp, _XP_SUFFIXES)
 
 
 def render_skill_table(skills: Dict[str, Any], category: Optional[str] = None) -> None:
     """Render a skill table, optionally filtered by category."""
-    from config import SKILL_CATEGORIES
     
     if category and category in SKILL_CATEGORIES:
         skill_names = SKILL_CATEGORIES[category]
     else:
         skill_names = [s for s in skills.keys() if s != "overall"]
     
-    rows = []
-    for name in skill_names:
-        if name in skills:
-            s = skills[name]
-            rows.append({
-                "Skill": name.title(),
-                "Level": s.level,
-                "XP": s.experience,
-                "Rank": s.rank if s.rank > 0 else "-",
-            })
+    selected = [skills[name] for name in skill_names if name in skills]
     
-    if rows:
-        import pandas as pd
-        df = pd.DataFrame(rows)
-        df["XP"] = df["XP"].apply(lambda x: f"{x:,}")
-        df["Rank"] = df["Rank"].apply(lambda x: f"{x:,}" if isinstance(x, int) else x)
+    if selected:
+        df = pd.DataFrame({
+            "Skill": [s.name.title() for s in selected],
+            "Level": np.fromiter((s.level for s in selected), dtype=np.int32, count=len(selected)),
+            "XP": [f"{s.experience:,}" for s in selected],
+            "Rank": [f"{s.rank:,}" if s.rank > 0 else "-" for s in selected],
+        })
         st.dataframe(df, hide_index=True, use_container_width=True)
     else:
         st.info("No skill data available")
@@ -1,18 +1,40 @@
 """Bosses page - PvM activity analysis."""
 
 import streamlit as st
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+from typing import Dict, Any, Tuple
 
-from config import BOSS_CATEGORIES
+from config import BOSS_CATEGORIES, BOSS_CATEGORY_SETS
 from analysis import PlayerProfile
-from ui.components import render_section_header
+from ui.components import render_section_header, render_stat_grid
 from ui.charts import create_boss_distribution
 
 
+_RAID_DISPLAY_NAMES = {
+    "chambers_of_xeric": "CoX",
+    "chambers_of_xeric_challenge_mode": "CoX CM",
+    "theatre_of_blood": "ToB",
+    "theatre_of_blood_hard_mode": "ToB HM",
+    "tombs_of_amascut": "ToA",
+    "tombs_of_amascut_expert": "ToA Expert",
+}
+
+
+@st.cache_resource(max_entries=128, show_spinner=False)
+def _boss_chart(boss_kc: Tuple[Tuple[str, int], ...], _bosses: Dict[str, Any]) -> go.Figure:
+    """Build the KC breakdown once per distinct set of kill counts."""
+    return create_boss_distribution(_bosses, top_n=15)
+
+
+@st.fragment
 def render_bosses_page(profile: PlayerProfile) -> None:
     """Render detailed boss/PvM analysis page."""
     
-    total_kc = sum(b.kills for b in profile.bosses.values() if b.kills > 0)
-    bosses_killed = len([b for b in profile.bosses.values() if b.kills > 0])
+    kills = {name: b.kills for name, b in profile.bosses.items() if b.kills > 0}
+    total_kc = sum(kills.values())
+    bosses_killed = len(kills)
     
     if total_kc == 0:
         st.warning("🏰 **No Boss Kills Recorded**")
@@ -30,7 +52,7 @@ def render_bosses_page(profile: PlayerProfile) -> None:
     
     render_section_header("Kill Count Breakdown", "💀")
     
-    boss_chart = create_boss_distribution(profile.bosses, top_n=15)
+    boss_chart = _boss_chart(tuple(kills.items()), profile.bosses)
     st.plotly_chart(boss_chart, use_container_width=True, config={'displayModeBar': False})
     
     st.divider()
@@ -38,50 +60,40 @@ def render_bosses_page(profile: PlayerProfile) -> None:
     render_section_header("Content Categories", "🗂️")
     
     for cat_name, boss_names in BOSS_CATEGORIES.items():
-        cat_bosses = [
-            (name, profile.bosses[name].kills)
-            for name in boss_names
-            if name in profile.bosses and profile.bosses[name].kills > 0
-        ]
-        
-        if not cat_bosses:
+        # C-level set check skips untouched categories before any array work
+        if BOSS_CATEGORY_SETS[cat_name].isdisjoint(kills):
             continue
         
-        cat_bosses.sort(key=lambda x: x[1], reverse=True)
-        cat_total = sum(kc for _, kc in cat_bosses)
+        kcs = profile.category_kc[cat_name]
+        killed = np.flatnonzero(kcs > 0)
+        
+        # Highest KC first; stable so ties keep category order
+        order = killed[np.argsort(-kcs[killed], kind="stable")]
+        cat_kcs = kcs[order]
+        cat_total = int(cat_kcs.sum())
         
         with st.expander(f"**{cat_name}** — {cat_total:,} total KC"):
-            for boss_name, kc in cat_bosses:
-                display_name = boss_name.replace("_", " ").title()
-                pct = (kc / cat_total) * 100
-                col1, col2 = st.columns([3, 1])
-                col1.write(display_name)
-                col2.write(f"**{kc:,}** ({pct:.1f}%)")
+            df = pd.DataFrame({
+                "Boss": [boss_names[i].replace("_", " ").title() for i in order],
+                "Kills": [f"{kc:,}" for kc in cat_kcs.tolist()],
+                "Share": [f"{pct:.1f}%" for pct in (cat_kcs / cat_total * 100).tolist()],
+            })
+            st.dataframe(df, hide_index=True, use_container_width=True)
     
     st.divider()
     render_section_header("Raid Experience", "🏆")
     
     raid_bosses = BOSS_CATEGORIES.get("Raids", [])
-    raid_data = [
-        (name, profile.bosses[name])
-        for name in raid_bosses
-        if name in profile.bosses and profile.bosses[name].kills > 0
-    ]
+    raid_kcs = profile.category_kc.get("Raids", np.zeros(0, dtype=np.int64))
+    raid_data = [(raid_bosses[i], int(raid_kcs[i])) for i in np.flatnonzero(raid_kcs > 0)]
     
     if raid_data:
-        raid_display_names = {
-            "chambers_of_xeric": "CoX",
-            "chambers_of_xeric_challenge_mode": "CoX CM",
-            "theatre_of_blood": "ToB",
-            "theatre_of_blood_hard_mode": "ToB HM",
-            "tombs_of_amascut": "ToA",
-            "tombs_of_amascut_expert": "ToA Expert",
-        }
-        
-        cols = st.columns(len(raid_data))
-        for i, (name, boss) in enumerate(raid_data):
-            display = raid_display_names.get(name, name.replace("_", " ").title())
-            with cols[i]:
-                st.metric(display, f"{boss.kills:,}")
+        render_stat_grid(
+            [
+                (_RAID_DISPLAY_NAMES.get(name, name.replace("_", " ").title()), f"{kills:,}")
+                for name, kills in raid_data
+            ],
+            columns=len(raid_data),
+        )
     else:
         st.info("No raid completions recorded. Time to form a team!")
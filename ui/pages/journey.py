@@ -1,13 +1,76 @@
 """Journey page - historical progression analysis."""
 
 import streamlit as st
-from typing import Dict, Any
+from functools import lru_cache
+from operator import itemgetter
+import numpy as np
+import plotly.graph_objects as go
+from typing import Dict, Any, List, Tuple
 
 from analysis import PlayerProfile
-from ui.components import render_section_header, render_data_coverage
+from ui.components import render_section_header, render_data_coverage, format_compact
 from ui.charts import create_journey_timeline
 
 
+_GAIN_SUFFIXES = ((1_000_000, "M", ".1f"),)
+_DAILY_SUFFIXES = ((1_000_000, "M", ".2f"),)
+
+
+@lru_cache(maxsize=4096)
+def _format_xp_gain(xp: int) -> str:
+    """Format an XP gain for the summary metric."""
+    return "+" + format_compact(xp, _GAIN_SUFFIXES, ",")
+
+
+@lru_cache(maxsize=4096)
+def _format_daily_xp(xp: float) -> str:
+    """Format an average daily XP rate."""
+    return format_compact(xp, _DAILY_SUFFIXES, ",.0f")
+
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def _journey_summary(first: Tuple, last: Tuple) -> Dict[str, Any]:
+    """
+    Compute the formatted progress summary between two timeline points.
+    
+    Points are (date, total_level, total_xp, ehp, ehb) tuples in
+    TimelinePoint field order, so reruns hit the cache on plain values.
+    """
+    first_date, first_level, first_xp, first_ehp, first_ehb = first
+    last_date, last_level, last_xp, last_ehp, last_ehb = last
+    
+    level_gain = last_level - first_level
+    xp_gain = last_xp - first_xp
+    ehp_gain = last_ehp - first_ehp
+    ehb_gain = last_ehb - first_ehb
+    days = (last_date - first_date).days
+    
+    summary = {
+        "days": days,
+        "levels": f"+{level_gain:,}" if level_gain >= 0 else str(level_gain),
+        "xp": _format_xp_gain(xp_gain),
+        "ehp": f"+{ehp_gain:.1f}",
+        "ehb": f"+{ehb_gain:.1f}",
+    }
+    if days > 0:
+        summary["xp_per_day"] = _format_daily_xp(xp_gain / days)
+        summary["ehp_per_day"] = f"{ehp_gain/days:.2f}"
+        summary["ehb_per_day"] = f"{ehb_gain/days:.2f}"
+    return summary
+
+
+@st.cache_resource(max_entries=64, show_spinner=False)
+def _timeline_chart(
+    dates_key: bytes,
+    levels_key: bytes,
+    _timeline: Dict[str, np.ndarray],
+    _milestones: List[Dict],
+) -> go.Figure:
+    """Build the progression chart once per distinct timeline."""
+    return create_journey_timeline(_timeline, _milestones)
+
+
+@st.fragment
 def render_journey_page(
     profile: PlayerProfile,
     journey_data: Dict[str, Any],
@@ -15,6 +78,7 @@ def render_journey_page(
     """Render historical progression analysis page."""
     
     timeline = journey_data.get("timeline", [])
+    timeline_columns = journey_data["timeline_columns"]
     milestones = journey_data.get("milestones", [])
     coverage = journey_data.get("data_coverage", "Unknown")
     snapshot_count = journey_data.get("snapshot_count", 0)
@@ -40,47 +104,53 @@ def render_journey_page(
     
     render_section_header("Progression Timeline", "📈")
     
-    timeline_fig = create_journey_timeline(timeline, milestones)
+    # Milestones derive from dates + levels, so the raw column bytes are a full key
+    timeline_fig = _timeline_chart(
+        timeline_columns["date"].tobytes(),
+        timeline_columns["total_level"].tobytes(),
+        timeline_columns,
+        milestones,
+    )
     st.plotly_chart(timeline_fig, use_container_width=True, config={'displayModeBar': False})
     
     if milestones:
         render_section_header("Milestones Detected", "🏅")
         
-        for m in sorted(milestones, key=lambda x: x["date"], reverse=True):
-            date_str = m["date"].strftime("%Y-%m-%d")
-            col1, col2 = st.columns([1, 3])
-            col1.caption(date_str)
-            col2.write(m['description'])
+        # Newest first; reverse=True keeps same-day milestones in level order
+        ordered = sorted(milestones, key=itemgetter("date"), reverse=True)
+        date_strs = [m["date"].strftime("%Y-%m-%d") for m in ordered]
+        rows = "".join(
+            f'<div style="display: flex; gap: 24px; padding: 4px 0;">'
+            f'<span style="color: var(--muted); min-width: 100px;">{date_str}</span>'
+            f'<span>{m["description"]}</span>'
+            f'</div>'
+            for date_str, m in zip(date_strs, ordered)
+        )
+        st.markdown(rows, unsafe_allow_html=True)
     
     if len(timeline) >= 2:
         render_section_header("Progress Summary", "📊")
         
         first = timeline[0]
         last = timeline[-1]
-        
-        level_gain = last["total_level"] - first["total_level"]
-        xp_gain = last["total_xp"] - first["total_xp"]
-        ehp_gain = last["ehp"] - first["ehp"]
-        ehb_gain = last["ehb"] - first["ehb"]
-        
-        days = (last["date"] - first["date"]).days
+        summary = _journey_summary(
+            (first.date, first.total_level, first.total_xp, first.ehp, first.ehb),
+            (last.date, last.total_level, last.total_xp, last.ehp, last.ehb),
+        )
+        days = summary["days"]
         
         col1, col2, col3, col4 = st.columns(4)
         
         col1.metric(
             "Total Levels",
-            f"+{level_gain:,}" if level_gain >= 0 else str(level_gain),
+            summary["levels"],
             delta=f"over {days} days"
         )
         
-        if xp_gain >= 1_000_000:
-            xp_str = f"+{xp_gain/1_000_000:.1f}M"
-        else:
-            xp_str = f"+{xp_gain:,}"
-        col2.metric("Total XP", xp_str)
+        col2.metric("Total XP", summary["xp"])
         
-        col3.metric("EHP Gained", f"+{ehp_gain:.1f}")
-        col4.metric("EHB Gained", f"+{ehb_gain:.1f}")
+        col3.metric("EHP Gained", summary["ehp"])
+        col4.metric("EHB Gained", summary["ehb"])
         
         if days > 0:
             st.divider()
@@ -88,14 +158,10 @@ def render_journey_page(
             
             col1, col2, col3 = st.columns(3)
             
-            daily_xp = xp_gain / days
-            if daily_xp >= 1_000_000:
-                col1.write(f"📊 XP/day: **{daily_xp/1_000_000:.2f}M**")
-            else:
-                col1.write(f"📊 XP/day: **{daily_xp:,.0f}**")
+            col1.write(f"📊 XP/day: **{summary['xp_per_day']}**")
             
-            col2.write(f"⏱️ EHP/day: **{ehp_gain/days:.2f}**")
-            col3.write(f"⚔️ EHB/day: **{ehb_gain/days:.2f}**")
+            col2.write(f"⏱️ EHP/day: **{summary['ehp_per_day']}**")
+            col3.write(f"⚔️ EHB/day: **{summary['ehb_per_day']}**")
 
 
 def render_current_snapshot(profile: PlayerProfile) -> None:
@@ -1,7 +1,8 @@
 """Player Profile page - main profile view."""
 
 import streamlit as st
-from typing import Dict, Any
+import plotly.graph_objects as go
+from typing import Dict, Any, Tuple
 
 from analysis import PlayerProfile
 from ui.components import (
@@ -18,6 +19,29 @@ from ui.charts import (
 )
 
 
+_FORMAT_KC = "{:,} KC".format
+
+# Figures are keyed by their plotted values and shared read-only across reruns
+
+@st.cache_resource(max_entries=128, show_spinner=False)
+def _radar_chart(skill_xp: Tuple[Tuple[str, int], ...], _skills: Dict[str, Any]) -> go.Figure:
+    """Build the skill radar once per distinct set of skill XP."""
+    return create_skill_radar(_skills)
+
+
+@st.cache_resource(max_entries=128, show_spinner=False)
+def _playstyle_chart(scores: Tuple[Tuple[str, float], ...]) -> go.Figure:
+    """Build the playstyle bars once per distinct set of scores."""
+    return create_playstyle_bars(dict(scores))
+
+
+@st.cache_resource(max_entries=128, show_spinner=False)
+def _efficiency_chart(ehp: float, ehb: float) -> go.Figure:
+    """Build the EHP/EHB display once per distinct pair."""
+    return create_ehp_ehb_display(ehp, ehb)
+
+
+@st.fragment
 def render_profile_page(
     profile: PlayerProfile,
     journey_data: Dict[str, Any],
@@ -40,19 +64,20 @@ def render_profile_page(
     
     with col1:
         render_section_header("Skill Balance", "⚖️")
-        radar_fig = create_skill_radar(profile.skills)
+        skill_xp = tuple((name, s.experience) for name, s in profile.skills.items())
+        radar_fig = _radar_chart(skill_xp, profile.skills)
         st.plotly_chart(radar_fig, use_container_width=True, config={'displayModeBar': False})
     
     with col2:
         render_section_header("Playstyle Profile", "🎯")
-        bars_fig = create_playstyle_bars(profile.playstyle_scores)
+        bars_fig = _playstyle_chart(tuple(profile.playstyle_scores.items()))
         st.plotly_chart(bars_fig, use_container_width=True, config={'displayModeBar': False})
     
     st.divider()
     
     # EHP/EHB display
     render_section_header("Efficiency Metrics", "⏱️")
-    efficiency_fig = create_ehp_ehb_display(profile.ehp, profile.ehb)
+    efficiency_fig = _efficiency_chart(profile.ehp, profile.ehb)
     st.plotly_chart(efficiency_fig, use_container_width=True, config={'displayModeBar': False})
     
     st.divider()
@@ -65,13 +90,15 @@ def render_profile_page(
             profile.top_skills,
             "Top Skills",
             value_formatter=format_xp,
-            icon="📚"
+            icon="📚",
+            columns=("Skill", "XP"),
         )
     
     with col2:
         render_top_items(
             profile.top_bosses,
             "Top Bosses",
-            value_formatter=lambda x: f"{x:,} KC",
-            icon="💀"
+            value_formatter=_FORMAT_KC,
+            icon="💀",
+            columns=("Boss", "Kills"),
         )
@@ -1,64 +1,80 @@
 """Skills Detail page - deep dive into skill data."""
 
 import streamlit as st
+import numpy as np
+import plotly.graph_objects as go
+from typing import Dict, Any, Tuple
 
 from config import SKILL_CATEGORIES
 from analysis import PlayerProfile
-from ui.components import render_section_header, render_skill_table
+from ui.components import render_section_header, render_skill_table, render_stat_grid
 from ui.charts import create_skill_distribution
 
 
+@st.cache_resource(max_entries=128, show_spinner=False)
+def _skill_treemap(skill_xp: Tuple[Tuple[str, int], ...], _skills: Dict[str, Any]) -> go.Figure:
+    """Build the XP treemap once per distinct set of skill XP."""
+    return create_skill_distribution(_skills)
+
+
+@st.fragment
+def _skill_table_fragment(skills: Dict[str, Any]) -> None:
+    """Category picker and table; a selection reruns only this block."""
+    
+    categories = list(SKILL_CATEGORIES.keys())
+    selected_category = st.selectbox(
+        "Select category",
+        options=["All Skills"] + categories,
+        index=0,
+    )
+    
+    if selected_category == "All Skills":
+        render_skill_table(skills)
+    else:
+        render_skill_table(skills, selected_category)
+
+
+@st.fragment
 def render_skills_page(profile: PlayerProfile) -> None:
     """Render detailed skills analysis page."""
     
     render_section_header("Skill Distribution", "📊")
     
-    treemap_fig = create_skill_distribution(profile.skills)
+    skill_xp = tuple((name, s.experience) for name, s in profile.skills.items())
+    treemap_fig = _skill_treemap(skill_xp, profile.skills)
     st.plotly_chart(treemap_fig, use_container_width=True, config={'displayModeBar': False})
     
     st.divider()
     
     render_section_header("Skills by Category", "📚")
     
-    categories = list(SKILL_CATEGORIES.keys())
-    selected_category = st.selectbox(
-        "Select category",
-        options=["All Skills"] + categories,
-        index=0,
-    )
-    
-    if selected_category == "All Skills":
-        render_skill_table(profile.skills)
-    else:
-        render_skill_table(profile.skills, selected_category)
+    _skill_table_fragment(profile.skills)
     
     st.divider()
     
     render_section_header("Category XP Totals", "📈")
     
-    col1, col2 = st.columns(2)
-    
-    for i, (cat, xp) in enumerate(profile.skill_category_xp.items()):
-        col = col1 if i % 2 == 0 else col2
-        with col:
-            st.metric(cat, f"{xp:,} XP")
+    render_stat_grid(
+        [(cat, f"{xp:,} XP") for cat, xp in profile.skill_category_xp.items()],
+        columns=2,
+    )
     
     st.divider()
     render_section_header("99+ Skills", "✨")
     
-    maxed_skills = [
-        (name, skill.virtual_level, skill.experience)
-        for name, skill in profile.skills.items()
-        if skill.level >= 99 and name != "overall"
-    ]
+    skills = [s for name, s in profile.skills.items() if name != "overall"]
+    levels = np.fromiter((s.level for s in skills), dtype=np.int32, count=len(skills))
+    xp = np.fromiter((s.experience for s in skills), dtype=np.int64, count=len(skills))
+    maxed = np.flatnonzero(levels >= 99)
     
-    if maxed_skills:
-        maxed_skills.sort(key=lambda x: x[2], reverse=True)
+    if maxed.size:
+        # Highest XP first; stable so ties keep skill order
+        order = maxed[np.argsort(-xp[maxed], kind="stable")]
         
-        cols = st.columns(4)
-        for i, (name, vlvl, xp) in enumerate(maxed_skills):
-            with cols[i % 4]:
-                over_99 = f" ({vlvl})" if vlvl > 99 else ""
-                st.metric(name.title(), f"99{over_99}")
+        stats = []
+        for i in order.tolist():
+            vlvl = skills[i].virtual_level
+            stats.append((skills[i].name.title(), f"99 ({vlvl})" if vlvl > 99 else "99"))
+        render_stat_grid(stats)
     else:
         st.info("No skills at level 99 yet. Keep grinding!")
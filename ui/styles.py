@@ -1,30 +1,91 @@
 """Custom CSS styles for the dashboard."""
 
-# Minimal CSS - just for font import
-CUSTOM_CSS = """
-<style>
-@import url('https://fonts.googleapis.com/css2?family=Cinzel:wght@400;600;700&family=Nunito:wght@300;400;600;700&display=swap');
-</style>
+import streamlit as st
+from functools import lru_cache
+from string import Template
+from typing import Final, Iterable, List, Tuple
+
+from config import COLORS
+
+
+# Font markup. <link> tags let the browser open the font connections in
+# parallel instead of a render-blocking CSS @import.
+_FONT_LINKS = """
+<link rel="preconnect" href="https://fonts.googleapis.com">
+<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+<link href="https://fonts.googleapis.com/css2?family=Cinzel:wght@400;600;700&family=Nunito:wght@300;400;600;700&display=swap" rel="stylesheet">
 """
 
+# Palette stylesheet; plain braces, only $-placeholders are substituted.
+# Written minified by hand - nothing here is rewritten after substitution.
+_CSS_TEMPLATE = Template("<style>:root{$variables}</style>")
 
-def render_empty_state(title: str, message: str, icon: str = "📭") -> str:
-    """Render an empty state message."""
-    return f"""
+
+@lru_cache(maxsize=4)
+def _css_for(colors_key: Tuple[Tuple[str, str], ...]) -> str:
+    """Build the head markup for a palette, exposing each color as a CSS variable."""
+    # Declarations are generated already minified: --name:value;
+    variables = "".join(f"--{name}:{value};" for name, value in colors_key)
+    return f"{_FONT_LINKS}{_CSS_TEMPLATE.substitute(variables=variables)}\n"
+
+
+CUSTOM_CSS: Final[str] = _css_for(tuple(sorted(COLORS.items())))
+
+
+def inject_css() -> None:
+    """Emit the head markup; call once near the top of every script run."""
+    # Streamlit drops elements a rerun doesn't re-emit, so this can't be
+    # skipped after the first run - the prebuilt string keeps it cheap
+    st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
+
+
+@lru_cache(maxsize=256)
+def hex_to_rgba(hex_color: str, alpha: float) -> str:
+    """Convert a #RRGGBB color to an rgba() string with the given alpha."""
+    r, g, b = bytes.fromhex(hex_color.lstrip("#"))
+    return f"rgba({r}, {g}, {b}, {alpha})"
+
+
+# Markdown skeletons filled via format_map
+_EMPTY_STATE_TMPL = """
 ### {icon} {title}
 
 {message}
 """
+_API_STATUS_TMPL = "{icon} {rate_limit}"
+_BADGE_TMPL = " ({label})"
+
+# Badges for WOM's known account types, built once
+_ACCOUNT_BADGES = {"regular": ""}
+_ACCOUNT_BADGES.update(
+    (t, _BADGE_TMPL.format_map({"label": t.replace("_", " ").title()}))
+    for t in ("ironman", "hardcore", "ultimate", "unknown")
+)
+
+
+@lru_cache(maxsize=512)
+def render_empty_state(title: str, message: str, icon: str = "📭") -> str:
+    """Render an empty state message."""
+    return _EMPTY_STATE_TMPL.format_map({"icon": icon, "title": title, "message": message})
 
 
+@lru_cache(maxsize=512)
 def render_api_status(has_key: bool, rate_limit: str) -> str:
     """Render API status indicator."""
     icon = "🔑" if has_key else "⚠️"
-    return f"{icon} {rate_limit}"
+    return _API_STATUS_TMPL.format_map({"icon": icon, "rate_limit": rate_limit})
 
 
 def get_account_badge(player_type: str) -> str:
     """Get display text for account type."""
-    if not player_type or player_type == "regular":
+    if not player_type:
         return ""
-    return f" ({player_type.replace('_', ' ').title()})"
+    badge = _ACCOUNT_BADGES.get(player_type)
+    if badge is None:
+        badge = _BADGE_TMPL.format_map({"label": player_type.replace("_", " ").title()})
+    return badge
+
+
+def get_account_badges(player_types: Iterable[str]) -> List[str]:
+    """Get badge text for a list of players in one call."""
+    return [get_account_badge(t) for t in player_types]